@@ -0,0 +1,61 @@
+import os
+import random
+import tempfile
+import time
+from datetime import date, timedelta
+from database.database import DataBase
+from task.task import Task
+
+WORDS = ("задача", "проект", "отчет", "встреча", "клиент", "документ", "проверить", "подготовить",
+         "согласовать", "отправить", "исправить", "обсудить", "срочно", "неделя", "договор", "бюджет")
+
+
+def make_store(file_path: str, size: int) -> DataBase:
+    """
+    Функция, создающая синтетическую базу задач заданного размера.
+
+    :param file_path: str, путь к файлу базы
+    :param size: int, количество задач
+    :return: DataBase, заполненная база в несжатом формате
+    """
+    rnd = random.Random(0)
+    open(file_path, 'w').close()
+    db = DataBase(file_path=file_path)
+    start = date(2027, 1, 1)
+    for _ in range(size):
+        db._tasks.append(Task(
+            db._next_id,
+            " ".join(rnd.choices(WORDS, k=3)),
+            " ".join(rnd.choices(WORDS, k=rnd.randint(20, 60))),
+            rnd.choice(WORDS),
+            start + timedelta(days=rnd.randint(0, 365)),
+            rnd.choice(("низкий", "средний", "высокий")),
+            rnd.choice(("выполнена", "не выполнена"))))
+        db._next_id += 1
+    return db
+
+
+def bench(size: int = 100_000):
+    """
+    Функция, сравнивающая размер файла и время сохранения/загрузки для всех форматов.
+
+    :param size: int, количество задач в синтетической базе
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        db = make_store(os.path.join(directory, 'source.json'), size)
+        print(f"{'формат':<8}{'размер, КБ':>14}{'сохранение, с':>16}{'загрузка, с':>14}")
+        for compression in (None, 'zlib', 'gzip', 'lzma'):
+            db.file_path = os.path.join(directory, f'{compression}.json')
+            db.compression = compression
+            started = time.perf_counter()
+            db.save_tasks()
+            saved = time.perf_counter() - started
+            started = time.perf_counter()
+            DataBase(file_path=db.file_path)
+            loaded = time.perf_counter() - started
+            print(f"{compression or 'json':<8}{os.path.getsize(db.file_path) / 1024:>14.0f}"
+                  f"{saved:>16.3f}{loaded:>14.3f}")
+
+
+if __name__ == '__main__':
+    bench()
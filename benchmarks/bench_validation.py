@@ -0,0 +1,39 @@
+import random
+import time
+from datetime import date, timedelta
+from database.validation import validate_tasks
+
+
+def make_rows(size: int) -> list:
+    """
+    Функция, создающая синтетические строки импорта, часть из которых некорректна.
+
+    :param size: int, количество строк
+    :return: list, строки импорта
+    """
+    rnd = random.Random(0)
+    start = date(2027, 1, 1)
+    dates = [(start + timedelta(days=day)).strftime('%d.%m.%Y') for day in range(730)] + ['31.02.2027', '2020-01-01']
+    priorities = ['низкий', 'средний', 'Высокий', 'срочный']
+    statuses = ['', 'не выполнена', 'выполнена', 'отложена']
+    return [{"title": f"задача {i}", "description": "описание задачи", "category": "работа",
+             "due_date": rnd.choice(dates), "priority": rnd.choice(priorities), "status": rnd.choice(statuses)}
+            for i in range(size)]
+
+
+def bench(size: int = 1_000_000):
+    """
+    Функция, измеряющая скорость пакетной проверки задач.
+
+    :param size: int, количество строк
+    """
+    rows = make_rows(size)
+    started = time.perf_counter()
+    report = validate_tasks(rows, today=date(2026, 12, 31))
+    elapsed = time.perf_counter() - started
+    print(f"Строк: {size}, принято: {len(report.valid)}, отклонено: {len(report.rejected)}, "
+          f"время: {elapsed:.2f} с ({size / elapsed:,.0f} строк/с)")
+
+
+if __name__ == '__main__':
+    bench()
@@ -0,0 +1,302 @@
+import json
+import logging
+import os
+import asyncio
+import threading
+from collections import deque
+from typing import Callable, Iterable, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+# Один кодировщик на все записи журнала: json.dumps с ensure_ascii=False создает новый на каждый вызов
+_encoder = json.JSONEncoder(ensure_ascii=False)
+EVENT_KEYS = frozenset(("seq", "action", "task_id", "task"))
+
+
+class ChangeEvent:
+    """
+    Класс ChangeEvent, представляющий изменение в базе задач
+
+    Attributes:
+        seq (int): монотонно возрастающий номер изменения
+        action (str): тип изменения (add, update, status, delete)
+        task_id (int): id измененной задачи
+        task (dict | None): задача после изменения, None для удаления
+    """
+
+    def __init__(self, seq: int, action: str, task_id: int, task: Optional[dict] = None):
+        """
+        Конструктор класса ChangeEvent
+
+        :param seq: int, номер изменения
+        :param action: str, тип изменения (add, update, status, delete)
+        :param task_id: int, id задачи
+        :param task: dict, задача после изменения в формате файла базы
+        """
+        self.seq = seq
+        self.action = action
+        self.task_id = task_id
+        self.task = task
+
+    def __repr__(self):
+        """
+        Метод __repr__
+        :return: str
+        """
+        return f"ChangeEvent(seq={self.seq}, action={self.action!r}, task_id={self.task_id})"
+
+    def to_dict(self) -> dict:
+        """
+        Метод, возвращающий изменение в виде словаря для записи в журнал.
+
+        :return: dict, словарь изменения
+        """
+        return {"seq": self.seq, "action": self.action, "task_id": self.task_id, "task": self.task}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'ChangeEvent':
+        """
+        Метод, создающий изменение из словаря журнала.
+
+        :param data: dict, словарь изменения
+        :return: ChangeEvent, изменение
+        """
+        return cls(data['seq'], data['action'], data['task_id'], data['task'])
+
+
+class ChangeFeed:
+    """
+    Класс ChangeFeed, рассылающий изменения базы подписчикам
+
+    Изменения передаются функциям обратного вызова, очередям asyncio и,
+    если указан путь, дописываются в журнал в формате JSON lines.
+
+    Запись изменения (record) и его рассылка (flush) разделены: DataBase записывает
+    изменения под блокировкой, а рассылает после её освобождения. Рассылка идет
+    строго в порядке номеров, ошибки подписчиков записываются в лог и не мешают
+    остальным подписчикам.
+
+    Attributes:
+        file_path (str | None): путь к журналу изменений
+        _seq (int): номер последнего изменения
+        _callbacks (list): подписанные функции обратного вызова
+        _queues (list): подписанные очереди asyncio и их циклы событий
+        _pending (deque): записанные, но еще не разосланные изменения
+        _line_start (str): префикс следующей записи: перевод строки, если журнал обрывается на неполной строке
+        _dispatch_lock (threading.RLock): блокировка, сохраняющая порядок рассылки
+    """
+
+    def __init__(self, file_path: Optional[str] = None):
+        """
+        Конструктор класса ChangeFeed
+
+        Если журнал уже существует, нумерация продолжается с его последнего изменения.
+
+        :param file_path: str, путь к журналу изменений
+        """
+        self.file_path = file_path
+        self._seq = self._last_seq()
+        self._line_start = '\n' if self._ends_with_partial_line() else ''
+        self._callbacks = []
+        self._queues = []
+        self._pending = deque()
+        self._dispatch_lock = threading.RLock()
+
+    @property
+    def seq(self) -> int:
+        """
+        Property, возвращающий номер последнего изменения
+
+        Returns:
+            int: номер последнего изменения
+        """
+        return self._seq
+
+    def _last_seq(self) -> int:
+        """
+        Метод, читающий номер последнего изменения из конца журнала.
+
+        Незавершенная последняя строка (после сбоя или во время записи другим процессом)
+        и строки, которые не удается разобрать, пропускаются.
+
+        :return: int, номер последнего изменения или 0, если журнала нет
+        """
+        if not self.file_path or not os.path.exists(self.file_path):
+            return 0
+        with open(self.file_path, 'rb') as file:
+            size = file.seek(0, os.SEEK_END)
+            block = 4096
+            while True:
+                file.seek(max(size - block, 0))
+                # Последний элемент - незавершенная строка или пустая строка после '\n'
+                lines = file.read().split(b'\n')[:-1]
+                if block < size:
+                    # Первая строка блока может быть обрезана
+                    lines = lines[1:]
+                for line in reversed(lines):
+                    data = self._parse_line(line)
+                    if data is not None:
+                        return data['seq']
+                if block >= size:
+                    return 0
+                block *= 2
+
+    def _ends_with_partial_line(self) -> bool:
+        """
+        Метод, проверяющий, что журнал обрывается на незавершенной строке.
+
+        :return: bool, True если последний байт журнала не перевод строки
+        """
+        if not self.file_path or not os.path.exists(self.file_path):
+            return False
+        with open(self.file_path, 'rb') as file:
+            if not file.seek(0, os.SEEK_END):
+                return False
+            file.seek(-1, os.SEEK_END)
+            return file.read(1) != b'\n'
+
+    @staticmethod
+    def _parse_line(line) -> Optional[dict]:
+        """
+        Метод, разбирающий строку журнала.
+
+        :param line: str | bytes, строка журнала
+        :return: dict | None, изменение в виде словаря или None, если строка повреждена
+        """
+        try:
+            data = json.loads(line)
+        except ValueError:
+            return None
+        if not isinstance(data, dict) or not isinstance(data.get('seq'), int) or not EVENT_KEYS <= data.keys():
+            return None
+        return data
+
+    def subscribe(self, callback: Callable[[ChangeEvent], None]):
+        """
+        Метод, подписывающий функцию на изменения.
+
+        Функция вызывается в потоке, изменившем базу, после освобождения блокировки,
+        поэтому может читать базу. Исключения функции записываются в лог.
+
+        :param callback: функция, принимающая ChangeEvent
+        """
+        self._callbacks.append(callback)
+
+    def unsubscribe(self, callback: Callable[[ChangeEvent], None]):
+        """
+        Метод, отписывающий функцию от изменений.
+
+        :param callback: ранее подписанная функция
+        """
+        self._callbacks.remove(callback)
+
+    def subscribe_queue(self) -> asyncio.Queue:
+        """
+        Метод, создающий очередь asyncio, в которую будут поступать изменения.
+
+        Вызывается из корутины: изменения передаются в цикл событий вызвавшего
+        потокобезопасно, поэтому база может изменяться из других потоков.
+
+        :return: asyncio.Queue, очередь изменений
+        """
+        queue = asyncio.Queue()
+        self._queues.append((queue, asyncio.get_running_loop()))
+        return queue
+
+    def unsubscribe_queue(self, queue: asyncio.Queue):
+        """
+        Метод, отписывающий очередь asyncio от изменений.
+
+        :param queue: asyncio.Queue, ранее созданная очередь
+        """
+        self._queues = [(q, loop) for q, loop in self._queues if q is not queue]
+
+    def record(self, action: str, task_id: int, task: Optional[dict] = None) -> ChangeEvent:
+        """
+        Метод, присваивающий изменению номер и дописывающий его в журнал без рассылки.
+
+        Вызывается под блокировкой на запись DataBase, чтобы номера совпадали
+        с порядком изменений. Разослать изменения нужно методом flush.
+
+        :param action: str, тип изменения (add, update, status, delete)
+        :param task_id: int, id задачи
+        :param task: dict, задача после изменения
+        :return: ChangeEvent, записанное изменение
+        """
+        self._seq += 1
+        event = ChangeEvent(self._seq, action, task_id, task)
+        if self.file_path:
+            with open(self.file_path, 'a', encoding='utf-8') as file:
+                file.write(self._line_start + _encoder.encode(event.to_dict()) + '\n')
+            self._line_start = ''
+        self._pending.append(event)
+        return event
+
+    def record_many(self, changes: Iterable[tuple]) -> List[ChangeEvent]:
+        """
+        Метод, записывающий набор изменений за одно открытие журнала.
+
+        :param changes: Iterable[tuple], изменения в виде (action, task_id, task)
+        :return: List[ChangeEvent], записанные изменения
+        """
+        events = []
+        for action, task_id, task in changes:
+            self._seq += 1
+            events.append(ChangeEvent(self._seq, action, task_id, task))
+        if self.file_path and events:
+            with open(self.file_path, 'a', encoding='utf-8') as file:
+                file.write(self._line_start + ''.join(_encoder.encode(event.to_dict()) + '\n' for event in events))
+            self._line_start = ''
+        self._pending.extend(events)
+        return events
+
+    def flush(self):
+        """
+        Метод, рассылающий подписчикам записанные изменения в порядке номеров.
+        """
+        with self._dispatch_lock:
+            while self._pending:
+                event = self._pending.popleft()
+                for callback in list(self._callbacks):
+                    try:
+                        callback(event)
+                    except Exception:
+                        logger.exception("Ошибка подписчика %r при обработке %r", callback, event)
+                for queue, loop in list(self._queues):
+                    try:
+                        loop.call_soon_threadsafe(queue.put_nowait, event)
+                    except RuntimeError:
+                        logger.exception("Цикл событий очереди закрыт, очередь отписана")
+                        self.unsubscribe_queue(queue)
+
+    def publish(self, action: str, task_id: int, task: Optional[dict] = None) -> ChangeEvent:
+        """
+        Метод, присваивающий изменению номер и рассылающий его подписчикам.
+
+        :param action: str, тип изменения (add, update, status, delete)
+        :param task_id: int, id задачи
+        :param task: dict, задача после изменения
+        :return: ChangeEvent, опубликованное изменение
+        """
+        event = self.record(action, task_id, task)
+        self.flush()
+        return event
+
+    def read_changes(self, since_seq: int = 0) -> Iterator[ChangeEvent]:
+        """
+        Метод, читающий из журнала изменения с номером больше since_seq.
+
+        Незавершенная последняя строка не читается: она будет прочитана при
+        следующем вызове, когда запись завершится. Поврежденные строки пропускаются.
+
+        :param since_seq: int, номер последнего уже обработанного изменения
+        :return: Iterator[ChangeEvent], изменения в порядке номеров
+        """
+        if not self.file_path or not os.path.exists(self.file_path):
+            return
+        with open(self.file_path, 'r', encoding='utf-8') as file:
+            for line in file:
+                if not line.endswith('\n'):
+                    break
+                data = self._parse_line(line)
+                if data is not None and data['seq'] > since_seq:
+                    yield ChangeEvent.from_dict(data)
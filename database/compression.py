@@ -0,0 +1,56 @@
+import gzip
+import lzma
+import zlib
+from functools import partial
+
+# gzip по умолчанию сжимает с уровнем 9: по benchmarks/bench_storage.py это втрое медленнее
+# уровня 6 при выигрыше в размере около 5%. lzma дает самый маленький файл ценой времени сохранения
+COMPRESSIONS = {
+    'gzip': (partial(gzip.compress, compresslevel=6), gzip.decompress),
+    'lzma': (lzma.compress, lzma.decompress),
+    'zlib': (zlib.compress, zlib.decompress),
+}
+
+
+def detect_compression(data: bytes):
+    """
+    Функция, определяющая алгоритм сжатия по первым байтам данных.
+
+    :param data: bytes, содержимое файла
+    :return: str | None, название алгоритма из COMPRESSIONS или None, если данные не сжаты
+    """
+    if data[:2] == b'\x1f\x8b':
+        return 'gzip'
+    if data[:6] == b'\xfd7zXZ\x00':
+        return 'lzma'
+    if data[:2] in (b'\x78\x01', b'\x78\x5e', b'\x78\x9c', b'\x78\xda'):
+        return 'zlib'
+    return None
+
+
+def compress(data: bytes, compression: str) -> bytes:
+    """
+    Функция, сжимающая данные указанным алгоритмом.
+
+    :param data: bytes, исходные данные
+    :param compression: str, название алгоритма (gzip, lzma, zlib)
+    :return: bytes, сжатые данные
+    """
+    try:
+        return COMPRESSIONS[compression][0](data)
+    except KeyError:
+        raise ValueError(f"Неизвестный алгоритм сжатия: {compression}") from None
+
+
+def decompress(data: bytes, compression: str) -> bytes:
+    """
+    Функция, распаковывающая данные указанным алгоритмом.
+
+    :param data: bytes, сжатые данные
+    :param compression: str, название алгоритма (gzip, lzma, zlib)
+    :return: bytes, исходные данные
+    """
+    try:
+        return COMPRESSIONS[compression][1](data)
+    except KeyError:
+        raise ValueError(f"Неизвестный алгоритм сжатия: {compression}") from None
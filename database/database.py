@@ -1,7 +1,19 @@
+import copy
 import json
+import os
+import shutil
+import tempfile
+from contextlib import contextmanager
 from task.task import Task
-from typing import List
+from typing import Callable, Iterable, List, Optional
 from datetime import date
+from database.lock import ReadWriteLock, NullLock
+from database.compression import COMPRESSIONS, compress, decompress, detect_compression
+from database.task_queue import TaskQueue
+from database.changes import ChangeEvent, ChangeFeed
+from database.validation import ValidationReport, validate_tasks
+
+TASK_FIELDS = ("id", "title", "description", "category", "due_date", "priority", "status")
 
 
 class DataBase:
@@ -12,28 +24,65 @@ class DataBase:
         file_path (str): путь к файлу с данными библиотеки
         _tasks (list): список задач
         _next_id (int): следующий id задачи
+        thread_safe (bool): включен ли потокобезопасный режим
+        _lock (ReadWriteLock | NullLock): блокировка "читатели-писатель"
+        compression (str | None): алгоритм сжатия файла (gzip, lzma, zlib) или None
+        _queue (TaskQueue): очередь невыполненных задач по срочности
+        changes (ChangeFeed): лента изменений базы для подписчиков
 
     """
 
-    def __init__(self, file_path='database.json'):
+    def __init__(self, file_path='database.json', thread_safe=False, compression=None, changes_path=None):
         """
         Конструктор класса DataBase
 
         :param file_path: путь к файлу с данными
+        :param thread_safe: bool, если True, чтения выполняются параллельно, а изменения - монопольно
+        :param compression: str, алгоритм сжатия файла (gzip, lzma, zlib). Если не указан,
+            используется формат, обнаруженный при загрузке файла
+        :param changes_path: str, путь к журналу изменений в формате JSON lines (опционально)
+        :raises ValueError: если алгоритм сжатия неизвестен
         """
+        if compression not in (None, *COMPRESSIONS):
+            raise ValueError(f"Неизвестный алгоритм сжатия: {compression}")
         self.file_path = file_path
+        self.thread_safe = thread_safe
+        self.compression = compression
+        self._lock = ReadWriteLock() if thread_safe else NullLock()
         self._tasks = self.load_tasks()
         self._next_id = self.get_next_id()
+        self._queue = TaskQueue(self._tasks)
+        self.changes = ChangeFeed(changes_path)
 
     @property
     def tasks(self) -> List[Task]:
         """
         Property, возвращающий список задач
 
+        В потокобезопасном режиме возвращаются копии задач, чтобы итерация
+        не зависела от параллельных изменений.
+
         Returns:
             list: список задач
         """
-        return self._tasks
+        if not self.thread_safe:
+            return self._tasks
+        with self._lock.read():
+            return self._snapshot(self._tasks)
+
+    def _snapshot(self, tasks: List[Task]) -> List[Task]:
+        """
+        Метод, возвращающий задачи для передачи за пределы блокировки.
+
+        В потокобезопасном режиме задачи копируются: update_task_info изменяет их
+        поля по одному, и читатель не должен видеть частично примененное изменение.
+
+        :param tasks: List[Task], задачи
+        :return: List[Task], копии задач в потокобезопасном режиме, иначе сами задачи
+        """
+        if not self.thread_safe:
+            return tasks
+        return [copy.copy(task) for task in tasks]
 
     @property
     def next_id(self) -> int:
@@ -43,7 +92,36 @@ class DataBase:
         Returns:
             int: следующий id задачи
         """
-        return self._next_id
+        with self._lock.read():
+            return self._next_id
+
+    @contextmanager
+    def _mutation(self):
+        """
+        Контекстный менеджер для изменяющих методов.
+
+        Захватывает блокировку на запись, а после её освобождения рассылает
+        записанные изменения подписчикам, чтобы они могли читать базу.
+        """
+        try:
+            with self._lock.write():
+                yield
+        finally:
+            self.changes.flush()
+
+    def subscribe_with_snapshot(self, callback: Callable[[ChangeEvent], None]) -> List[Task]:
+        """
+        Метод, подписывающий функцию на изменения и возвращающий текущие задачи.
+
+        Оба шага выполняются под блокировкой на запись, поэтому каждое изменение
+        либо уже отражено в возвращенных задачах, либо будет передано подписчику.
+
+        :param callback: функция, принимающая ChangeEvent
+        :return: List[Task], задачи на момент подписки
+        """
+        with self._lock.write():
+            self.changes.subscribe(callback)
+            return self._snapshot(list(self._tasks))
 
     def datetime_encoder(self, obj):
         if isinstance(obj, date):
@@ -56,27 +134,56 @@ class DataBase:
         except (ValueError, TypeError):
             pass
 
+    def task_to_dict(self, task: Task) -> dict:
+        """
+        Метод, преобразующий задачу в словарь в формате файла базы.
+
+        :param task: Task, задача
+        :return: dict, словарь задачи
+        """
+        return {
+            "id": task.task_id,
+            "title": task.title,
+            "description": task.description,
+            "category": task.category,
+            "due_date": self.datetime_encoder(task.due_date),
+            "priority": task.priority,
+            "status": task.status
+        }
+
     def load_tasks(self) -> List[Task]:
         """
         Метод, загружающий список задач из файла.
 
+        Сжатый файл и компактный формат без ключей определяются автоматически.
+        Если алгоритм сжатия не был задан явно, запоминается обнаруженный.
+
         :return: List[Task], Список задач
         """
         result = []
-        with open(self.file_path, 'r', encoding='utf-8') as file:
-            try:
-                temp_result = json.load(file)
-                for task in temp_result:
-                    result.append(Task(task['id'],
-                                       task['title'],
-                                       task['description'],
-                                       task['category'],
-                                       self.datetime_decoder(task['due_date']),
-                                       task['priority'],
-                                       task['status']))
-                return result
-            except json.JSONDecodeError:
-                return result
+        with open(self.file_path, 'rb') as file:
+            data = file.read()
+        compression = detect_compression(data)
+        if compression:
+            data = decompress(data, compression)
+            if self.compression is None:
+                self.compression = compression
+        try:
+            temp_result = json.loads(data)
+        except json.JSONDecodeError:
+            return result
+        if isinstance(temp_result, dict):
+            index = [temp_result['fields'].index(field) for field in TASK_FIELDS]
+            temp_result = [dict(zip(TASK_FIELDS, [row[i] for i in index])) for row in temp_result['rows']]
+        for task in temp_result:
+            result.append(Task(task['id'],
+                               task['title'],
+                               task['description'],
+                               task['category'],
+                               self.datetime_decoder(task['due_date']),
+                               task['priority'],
+                               task['status']))
+        return result
 
     def get_next_id(self) -> int:
         """
@@ -93,19 +200,44 @@ class DataBase:
         Метод проходит по списку задач, создает из них словари,
         и сохраняет их в файле, указанном в self.file_path
         """
-        result = []
-        with open(self.file_path, 'w', encoding='utf-8') as file:
-            for task in self.tasks:
-                result.append({
-                    "id": task.task_id,
-                    "title": task.title,
-                    "description": task.description,
-                    "category": task.category,
-                    "due_date": self.datetime_encoder(task.due_date),
-                    "priority": task.priority,
-                    "status": task.status
-                })
-            json.dump(result, file, ensure_ascii=False, indent=4)
+        with self._lock.write():
+            self._save_tasks()
+
+    def _save_tasks(self):
+        """
+        Метод, сохраняющий список задач в файл без захвата блокировки.
+
+        Вызывается из методов, уже удерживающих блокировку на запись.
+        Если задан алгоритм сжатия, задачи сохраняются компактными строками без ключей.
+        Данные записываются во временный файл, который затем заменяет исходный,
+        поэтому при ошибке или во время сжатия файл базы остается целым.
+        """
+        if self.compression:
+            rows = [[task.task_id,
+                     task.title,
+                     task.description,
+                     task.category,
+                     self.datetime_encoder(task.due_date),
+                     task.priority,
+                     task.status] for task in self._tasks]
+            data = json.dumps({"fields": TASK_FIELDS, "rows": rows}, ensure_ascii=False, separators=(',', ':'))
+            data = compress(data.encode('utf-8'), self.compression)
+        else:
+            result = []
+            for task in self._tasks:
+                result.append(self.task_to_dict(task))
+            data = json.dumps(result, ensure_ascii=False, indent=4).encode('utf-8')
+        file_descriptor, temp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(self.file_path)),
+                                                      suffix='.tmp')
+        try:
+            with os.fdopen(file_descriptor, 'wb') as file:
+                file.write(data)
+            if os.path.exists(self.file_path):
+                shutil.copymode(self.file_path, temp_path)
+            os.replace(temp_path, self.file_path)
+        except BaseException:
+            os.remove(temp_path)
+            raise
 
     def add_task(self, task_title: str, task_description: str, task_category: str, task_due_date: date,
                  task_priority: str):
@@ -118,11 +250,39 @@ class DataBase:
         :param task_due_date: date, срок выполнения задачи
         :param task_priority: str, приоритет задачи (низкий, средний, высокий)
         """
-        task = Task(self._next_id, task_title, task_description, task_category, task_due_date, task_priority,
-                    status='не выполнена')
-        self._tasks.append(task)
-        self._next_id += 1
-        self.save_tasks()
+        with self._mutation():
+            task = Task(self._next_id, task_title, task_description, task_category, task_due_date, task_priority,
+                        status='не выполнена')
+            self._tasks.append(task)
+            self._next_id += 1
+            self._queue.update(task)
+            self._save_tasks()
+            self.changes.record('add', task.task_id, self.task_to_dict(task))
+
+    def import_tasks(self, rows: Iterable[dict]) -> ValidationReport:
+        """
+        Метод, добавляющий набор задач после пакетной проверки.
+
+        Корректные задачи получают новые id и сохраняются в файл один раз,
+        отклоненные строки возвращаются в отчете вместе со всеми ошибками.
+
+        :param rows: Iterable[dict], строки с ключами title, description, category, due_date, priority, status
+        :return: ValidationReport, отчет о проверке
+        """
+        report = validate_tasks(rows)
+        with self._mutation():
+            added = []
+            for row in report.valid:
+                task = Task(self._next_id, row['title'], row['description'], row['category'], row['due_date'],
+                            row['priority'], row['status'])
+                self._tasks.append(task)
+                self._next_id += 1
+                self._queue.update(task)
+                added.append(task)
+            if added:
+                self._save_tasks()
+                self.changes.record_many(('add', task.task_id, self.task_to_dict(task)) for task in added)
+        return report
 
     def delete_task(self, task_id: int) -> bool:
         """
@@ -131,12 +291,15 @@ class DataBase:
         :param task_id: int, id задачи, которую нужно удалить
         :return: bool, True если задача была удалена, False если не найдена
         """
-        for task in self._tasks:
-            if task.task_id == task_id:
-                self._tasks.remove(task)
-                self.save_tasks()
-                return True
-        return False
+        with self._mutation():
+            for task in self._tasks:
+                if task.task_id == task_id:
+                    self._tasks.remove(task)
+                    self._queue.discard(task_id)
+                    self._save_tasks()
+                    self.changes.record('delete', task_id)
+                    return True
+            return False
 
     def search_task(self, **kwargs) -> List[Task]:
         """
@@ -145,7 +308,8 @@ class DataBase:
         :param kwargs: словарь, содержащий поля, по которым производится поиск
         :return: list[Task], список задач, удовлетворяющих критериям поиска
         """
-        results = [task for task in self._tasks if task.search(**kwargs)]
+        with self._lock.read():
+            results = self._snapshot([task for task in self._tasks if task.search(**kwargs)])
         return results
 
     def update_task_info(self, task_id: int, **kwargs) -> bool:
@@ -156,13 +320,16 @@ class DataBase:
         :param kwargs: dict, словарь, содержащий новые параметры
         :return: bool, True если задача была обновлена, False если не найдена
         """
-        for task in self._tasks:
-            if task.task_id == task_id:
-                for key, value in kwargs.items():
-                    setattr(task, key, value)
-                self.save_tasks()
-                return True
-        return False
+        with self._mutation():
+            for task in self._tasks:
+                if task.task_id == task_id:
+                    for key, value in kwargs.items():
+                        setattr(task, key, value)
+                    self._queue.update(task)
+                    self._save_tasks()
+                    self.changes.record('update', task_id, self.task_to_dict(task))
+                    return True
+            return False
 
     def update_task_status(self, task_id: int, new_task_status: str) -> bool:
         """
@@ -172,9 +339,62 @@ class DataBase:
         :param new_task_status: str, новый статус задачи
         :return: bool, True если задача была найдена и статус был изменен, False если не найдена
         """
-        for task in self._tasks:
-            if task.task_id == task_id:
-                task.status = new_task_status
-                self.save_tasks()
-                return True
-        return False
+        with self._mutation():
+            for task in self._tasks:
+                if task.task_id == task_id:
+                    self._set_status(task, new_task_status)
+                    return True
+            return False
+
+    def _set_status(self, task: Task, new_task_status: str):
+        """
+        Метод, изменяющий статус задачи без захвата блокировки.
+
+        Общий для update_task_status и pop_next: обновляет очередь, сохраняет файл
+        и записывает изменение в ленту.
+
+        :param task: Task, задача
+        :param new_task_status: str, новый статус задачи
+        """
+        task.status = new_task_status
+        self._queue.update(task)
+        self._save_tasks()
+        self.changes.record('status', task.task_id, self.task_to_dict(task))
+
+    def peek_next(self) -> Optional[Task]:
+        """
+        Метод, возвращающий самую срочную невыполненную задачу.
+
+        Задачи упорядочены по приоритету (высокий, средний, низкий), сроку выполнения и id.
+
+        :return: Task | None, задача или None, если невыполненных задач нет
+        """
+        with self._lock.write():
+            task = self._queue.peek()
+            return task if task is None else self._snapshot([task])[0]
+
+    def pop_next(self, new_task_status: str = 'выполнена') -> Optional[Task]:
+        """
+        Метод, забирающий самую срочную невыполненную задачу в работу.
+
+        Статус задачи меняется так же, как в update_task_status, и задача покидает очередь.
+
+        :param new_task_status: str, новый статус задачи
+        :return: Task | None, задача или None, если невыполненных задач нет
+        """
+        with self._mutation():
+            task = self._queue.pop()
+            if task is None:
+                return None
+            self._set_status(task, new_task_status)
+            return self._snapshot([task])[0]
+
+    def top_k(self, n: int) -> List[Task]:
+        """
+        Метод, возвращающий n самых срочных невыполненных задач.
+
+        :param n: int, количество задач
+        :return: List[Task], задачи в порядке срочности
+        """
+        with self._lock.read():
+            return self._snapshot(self._queue.top_k(n))
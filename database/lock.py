@@ -0,0 +1,106 @@
+import threading
+from contextlib import contextmanager
+
+
+class ReadWriteLock:
+    """
+    Класс ReadWriteLock, реализующий блокировку "читатели-писатель"
+
+    Несколько читателей могут удерживать блокировку одновременно, писатель получает
+    её монопольно. Ожидающий писатель блокирует вход новых читателей, чтобы
+    постоянный поток чтений не мог бесконечно откладывать запись.
+
+    Attributes:
+        _condition (threading.Condition): условие, защищающее счетчики
+        _readers (int): количество активных читателей
+        _writer (bool): True, если блокировку удерживает писатель
+        _waiting_writers (int): количество ожидающих писателей
+    """
+
+    def __init__(self):
+        """
+        Конструктор класса ReadWriteLock
+        """
+        self._condition = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writer = False
+        self._waiting_writers = 0
+
+    def acquire_read(self):
+        """
+        Метод, захватывающий блокировку на чтение.
+        """
+        with self._condition:
+            while self._writer or self._waiting_writers:
+                self._condition.wait()
+            self._readers += 1
+
+    def release_read(self):
+        """
+        Метод, освобождающий блокировку на чтение.
+        """
+        with self._condition:
+            self._readers -= 1
+            if not self._readers:
+                self._condition.notify_all()
+
+    def acquire_write(self):
+        """
+        Метод, захватывающий блокировку на запись.
+        """
+        with self._condition:
+            self._waiting_writers += 1
+            while self._writer or self._readers:
+                self._condition.wait()
+            self._waiting_writers -= 1
+            self._writer = True
+
+    def release_write(self):
+        """
+        Метод, освобождающий блокировку на запись.
+        """
+        with self._condition:
+            self._writer = False
+            self._condition.notify_all()
+
+    @contextmanager
+    def read(self):
+        """
+        Контекстный менеджер для блокировки на чтение.
+        """
+        self.acquire_read()
+        try:
+            yield
+        finally:
+            self.release_read()
+
+    @contextmanager
+    def write(self):
+        """
+        Контекстный менеджер для блокировки на запись.
+        """
+        self.acquire_write()
+        try:
+            yield
+        finally:
+            self.release_write()
+
+
+class NullLock:
+    """
+    Класс NullLock, заглушка с интерфейсом ReadWriteLock для однопоточного режима
+    """
+
+    @contextmanager
+    def read(self):
+        """
+        Контекстный менеджер, ничего не блокирующий.
+        """
+        yield
+
+    @contextmanager
+    def write(self):
+        """
+        Контекстный менеджер, ничего не блокирующий.
+        """
+        yield
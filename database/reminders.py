@@ -0,0 +1,194 @@
+import heapq
+import itertools
+import logging
+import threading
+from datetime import date, datetime, time, timedelta
+from typing import Callable, Iterable, List, Optional
+from database.changes import ChangeEvent
+from database.task_queue import OPEN_STATUS
+
+logger = logging.getLogger(__name__)
+
+
+class ReminderScheduler:
+    """
+    Класс ReminderScheduler, напоминающий о приближении срока выполнения задач
+
+    Напоминания хранятся в min-куче по времени срабатывания и обновляются по ленте
+    изменений DataBase, поэтому tick обрабатывает только сработавшие напоминания,
+    а не всю базу. Устаревшие записи кучи отбрасываются лениво, как в TaskQueue.
+    Срок выполнения задачи наступает в полночь дня due_date.
+
+    Attributes:
+        database (DataBase): база задач
+        callback (Callable): функция, вызываемая как callback(task_id, due_date, lead_time)
+        lead_times (list): за сколько до срока напоминать
+        clock (Callable): функция, возвращающая текущее время
+        _heap (list): куча записей (время срабатывания, номер записи, id задачи, версия, lead_time)
+        _scheduled (dict): срок и версия напоминаний для каждого id задачи
+        _lock (threading.Lock): блокировка, защищающая кучу
+        _wakeup (threading.Event): событие, прерывающее ожидание в run
+        _stopped (threading.Event): событие остановки run
+    """
+
+    def __init__(self, database, callback: Callable[[int, date, timedelta], None],
+                 lead_times: Iterable[timedelta] = (timedelta(days=1),),
+                 clock: Callable[[], datetime] = datetime.now):
+        """
+        Конструктор класса ReminderScheduler
+
+        Планирует напоминания для текущих невыполненных задач и подписывается на изменения базы.
+        Оба шага выполняются одним вызовом DataBase.subscribe_with_snapshot, чтобы ни одно
+        изменение между ними не было пропущено. Изменения, пришедшие до окончания
+        начального планирования, ждут на блокировке планировщика.
+
+        :param database: DataBase, база задач
+        :param callback: функция, вызываемая при срабатывании напоминания
+        :param lead_times: Iterable[timedelta], за сколько до срока напоминать
+        :param clock: функция, возвращающая текущее время (datetime)
+        """
+        self.database = database
+        self.callback = callback
+        self.lead_times = sorted(lead_times, reverse=True)
+        self.clock = clock
+        self._heap = []
+        self._scheduled = {}
+        self._versions = itertools.count()
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        with self._lock:
+            for task in database.subscribe_with_snapshot(self.on_change):
+                self._schedule(task.task_id, task.due_date if task.status == OPEN_STATUS else None)
+
+    def __len__(self) -> int:
+        """
+        Метод __len__
+        :return: int, количество задач с запланированными напоминаниями
+        """
+        return len(self._scheduled)
+
+    def _schedule(self, task_id: int, due_date: Optional[date]):
+        """
+        Метод, планирующий напоминания задачи или отменяющий их, если срок не задан.
+
+        Если срок не изменился, уже запланированные и сработавшие напоминания сохраняются.
+
+        :param task_id: int, id задачи
+        :param due_date: date | None, срок выполнения или None для отмены
+        """
+        current = self._scheduled.get(task_id)
+        if current is not None and current[0] == due_date:
+            return
+        if due_date is None:
+            self._scheduled.pop(task_id, None)
+            self._compact()
+            return
+        version = next(self._versions)
+        self._scheduled[task_id] = (due_date, version)
+        deadline = datetime.combine(due_date, time.min)
+        if deadline >= self.clock():
+            for lead_time in self.lead_times:
+                heapq.heappush(self._heap, (deadline - lead_time, next(self._counter), task_id, version, lead_time))
+            self._wakeup.set()
+        self._compact()
+
+    def _compact(self):
+        """
+        Метод, перестраивающий кучу, когда устаревших записей становится больше актуальных.
+        """
+        if len(self._heap) > 2 * len(self._scheduled) * len(self.lead_times) + 16:
+            self._heap = [entry for entry in self._heap if self._is_valid(entry)]
+            heapq.heapify(self._heap)
+
+    def _is_valid(self, entry: tuple) -> bool:
+        """
+        Метод, проверяющий, что запись кучи не устарела.
+
+        :param entry: tuple, запись кучи
+        :return: bool, True если запись актуальна
+        """
+        current = self._scheduled.get(entry[2])
+        return current is not None and current[1] == entry[3]
+
+    def on_change(self, event: ChangeEvent):
+        """
+        Метод, обновляющий напоминания по изменению базы.
+
+        :param event: ChangeEvent, изменение базы
+        """
+        due_date = None
+        if event.task is not None and event.task['status'] == OPEN_STATUS and event.task['due_date']:
+            due_date = date.fromisoformat(event.task['due_date'])
+        with self._lock:
+            self._schedule(event.task_id, due_date)
+
+    def next_fire_time(self) -> Optional[datetime]:
+        """
+        Метод, возвращающий время ближайшего напоминания.
+
+        :return: datetime | None, время срабатывания или None, если напоминаний нет
+        """
+        with self._lock:
+            while self._heap and not self._is_valid(self._heap[0]):
+                heapq.heappop(self._heap)
+            return self._heap[0][0] if self._heap else None
+
+    def tick(self) -> List[tuple]:
+        """
+        Метод, вызывающий callback для всех наступивших напоминаний.
+
+        Исключения callback записываются в лог и не мешают остальным напоминаниям.
+
+        :return: List[tuple], сработавшие напоминания (task_id, due_date, lead_time)
+        """
+        now = self.clock()
+        fired = []
+        with self._lock:
+            while self._heap and self._heap[0][0] <= now:
+                _, _, task_id, version, lead_time = heapq.heappop(self._heap)
+                current = self._scheduled.get(task_id)
+                if current is not None and current[1] == version:
+                    fired.append((task_id, current[0], lead_time))
+        for reminder in fired:
+            try:
+                self.callback(*reminder)
+            except Exception:
+                logger.exception("Ошибка при обработке напоминания %r", reminder)
+        return fired
+
+    def run(self, max_interval: float = 60):
+        """
+        Метод, вызывающий tick до вызова stop. Предназначен для запуска в отдельном потоке.
+
+        Между вызовами метод ждет до ближайшего напоминания, но не дольше max_interval секунд.
+        Новое напоминание и вызов stop прерывают ожидание.
+
+        :param max_interval: float, максимальное время ожидания в секундах
+        """
+        while not self._stopped.is_set():
+            self._wakeup.clear()
+            self.tick()
+            next_fire_time = self.next_fire_time()
+            timeout = max_interval
+            if next_fire_time is not None:
+                timeout = min(max((next_fire_time - self.clock()).total_seconds(), 0), max_interval)
+            self._wakeup.wait(timeout)
+
+    def stop(self):
+        """
+        Метод, останавливающий run и отписывающий планировщик от изменений базы.
+        """
+        self._stopped.set()
+        self._wakeup.set()
+        self.close()
+
+    def close(self):
+        """
+        Метод, отписывающий планировщик от изменений базы. Повторный вызов ничего не делает.
+        """
+        try:
+            self.database.changes.unsubscribe(self.on_change)
+        except ValueError:
+            pass
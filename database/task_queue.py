@@ -0,0 +1,144 @@
+import heapq
+import itertools
+from datetime import date
+from typing import List, Optional
+from task.task import Task
+
+OPEN_STATUS = 'не выполнена'
+PRIORITY_RANKS = {'высокий': 0, 'средний': 1, 'низкий': 2}
+
+
+class TaskQueue:
+    """
+    Класс TaskQueue, очередь невыполненных задач на основе двоичной кучи
+
+    Задачи упорядочены по (приоритет, срок выполнения, id). Изменённые и удалённые
+    задачи не удаляются из кучи сразу: их записи помечаются устаревшими и
+    отбрасываются при выходе на вершину (ленивая инвалидация).
+
+    Attributes:
+        _heap (list): двоичная куча записей (ранг приоритета, срок, id, номер записи, задача)
+        _entries (dict): актуальная запись кучи для каждого id невыполненной задачи
+        _counter (itertools.count): счетчик, различающий записи одной задачи
+    """
+
+    def __init__(self, tasks: List[Task] = ()):
+        """
+        Конструктор класса TaskQueue
+
+        :param tasks: List[Task], начальный список задач
+        """
+        self._entries = {}
+        self._counter = itertools.count()
+        for task in tasks:
+            if task.status == OPEN_STATUS:
+                self._entries[task.task_id] = self._make_entry(task)
+        self._heap = list(self._entries.values())
+        heapq.heapify(self._heap)
+
+    def __len__(self) -> int:
+        """
+        Метод __len__
+        :return: int, количество невыполненных задач в очереди
+        """
+        return len(self._entries)
+
+    def _make_entry(self, task: Task) -> tuple:
+        """
+        Метод, создающий запись кучи для задачи.
+
+        Неизвестные приоритеты и пустой срок выполнения попадают в конец очереди.
+
+        :param task: Task, задача
+        :return: tuple, запись кучи
+        """
+        return (PRIORITY_RANKS.get(task.priority, len(PRIORITY_RANKS)),
+                task.due_date if task.due_date is not None else date.max,
+                task.task_id,
+                next(self._counter),
+                task)
+
+    def _is_valid(self, entry: tuple) -> bool:
+        """
+        Метод, проверяющий, что запись кучи не устарела.
+
+        :param entry: tuple, запись кучи
+        :return: bool, True если запись актуальна
+        """
+        return self._entries.get(entry[2]) is entry
+
+    def update(self, task: Task):
+        """
+        Метод, добавляющий задачу в очередь или обновляющий её позицию.
+
+        Если задача больше не является невыполненной, она удаляется из очереди.
+
+        :param task: Task, добавленная или изменённая задача
+        """
+        if task.status != OPEN_STATUS:
+            self.discard(task.task_id)
+            return
+        entry = self._make_entry(task)
+        self._entries[task.task_id] = entry
+        heapq.heappush(self._heap, entry)
+        self._compact()
+
+    def discard(self, task_id: int):
+        """
+        Метод, удаляющий задачу из очереди.
+
+        :param task_id: int, id задачи
+        """
+        if self._entries.pop(task_id, None) is not None:
+            self._compact()
+
+    def _compact(self):
+        """
+        Метод, перестраивающий кучу, когда устаревших записей становится больше актуальных.
+        """
+        if len(self._heap) > 2 * len(self._entries) + 16:
+            self._heap = list(self._entries.values())
+            heapq.heapify(self._heap)
+
+    def peek(self) -> Optional[Task]:
+        """
+        Метод, возвращающий самую срочную невыполненную задачу без удаления.
+
+        :return: Task | None, задача или None, если очередь пуста
+        """
+        while self._heap and not self._is_valid(self._heap[0]):
+            heapq.heappop(self._heap)
+        return self._heap[0][4] if self._heap else None
+
+    def pop(self) -> Optional[Task]:
+        """
+        Метод, извлекающий самую срочную невыполненную задачу из очереди.
+
+        :return: Task | None, задача или None, если очередь пуста
+        """
+        task = self.peek()
+        if task is not None:
+            heapq.heappop(self._heap)
+            del self._entries[task.task_id]
+        return task
+
+    def top_k(self, n: int) -> List[Task]:
+        """
+        Метод, возвращающий n самых срочных невыполненных задач без изменения кучи.
+
+        Куча обходится от вершины через вспомогательную кучу индексов,
+        поэтому просматриваются только O(n) узлов, а не вся очередь.
+
+        :param n: int, количество задач
+        :return: List[Task], задачи в порядке срочности
+        """
+        result = []
+        candidates = [(self._heap[0], 0)] if self._heap else []
+        while candidates and len(result) < n:
+            entry, index = heapq.heappop(candidates)
+            if self._is_valid(entry):
+                result.append(entry[4])
+            for child in (2 * index + 1, 2 * index + 2):
+                if child < len(self._heap):
+                    heapq.heappush(candidates, (self._heap[child], child))
+        return result
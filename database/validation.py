@@ -0,0 +1,131 @@
+import csv
+import json
+from datetime import date
+from functools import lru_cache
+from typing import Iterable, List, Optional
+
+PRIORITIES = frozenset(('низкий', 'средний', 'высокий'))
+STATUSES = frozenset(('выполнена', 'не выполнена'))
+TEXT_FIELDS = ('title', 'description', 'category')
+
+
+@lru_cache(maxsize=65536)
+def parse_date(value: str) -> date:
+    """
+    Функция, разбирающая срок выполнения в формате дд.мм.гггг или гггг-мм-дд.
+
+    Результаты кэшируются: в пакетном импорте одни и те же даты повторяются
+    многократно, а разбор срезами заметно быстрее datetime.strptime.
+
+    :param value: str, строка с датой
+    :return: date, дата
+    :raises ValueError: если строка не является корректной датой
+    """
+    if len(value) == 10 and value[2] == '.' and value[5] == '.':
+        day, month, year = value[:2], value[3:5], value[6:]
+        if day.isdigit() and month.isdigit() and year.isdigit():
+            return date(int(year), int(month), int(day))
+        raise ValueError(value)
+    return date.fromisoformat(value)
+
+
+class ValidationReport:
+    """
+    Класс ValidationReport, результат пакетной проверки задач
+
+    Attributes:
+        valid (list): корректные задачи в виде словарей с разобранными значениями
+        rejected (list): отклоненные строки в виде (номер строки, исходная строка, список ошибок)
+    """
+
+    def __init__(self):
+        """
+        Конструктор класса ValidationReport
+        """
+        self.valid = []
+        self.rejected = []
+
+    def __str__(self):
+        """
+        Метод __str__
+        :return: str
+        """
+        lines = [f"Принято: {len(self.valid)}, отклонено: {len(self.rejected)}"]
+        for number, _, errors in self.rejected:
+            lines.append(f"Строка {number}: {'; '.join(errors)}")
+        return '\n'.join(lines)
+
+
+def validate_tasks(rows: Iterable[dict], today: Optional[date] = None) -> ValidationReport:
+    """
+    Функция, проверяющая набор задач для пакетного импорта.
+
+    Как и в IOWorker.add_task, срок выполнения должен быть позже сегодняшнего дня, а приоритет
+    и статус - из допустимых значений. Дополнительно, только для импорта, требуется непустое
+    название: IOWorker.add_task его не проверяет. Строки приводятся к нижнему регистру,
+    отсутствующий статус считается 'не выполнена'. Для каждой строки собираются все ошибки.
+
+    :param rows: Iterable[dict], строки с ключами title, description, category, due_date, priority, status.
+        Строки, не являющиеся словарями, отклоняются
+    :param today: date, текущая дата (по умолчанию date.today())
+    :return: ValidationReport, корректные задачи и отклоненные строки
+    """
+    today = today or date.today()
+    report = ValidationReport()
+    valid, rejected = report.valid, report.rejected
+    for number, row in enumerate(rows, start=1):
+        if not isinstance(row, dict):
+            rejected.append((number, row, ["строка должна быть объектом"]))
+            continue
+        errors = []
+        task = {}
+        for field in TEXT_FIELDS:
+            value = row.get(field)
+            if value is None:
+                value = ''
+            elif not isinstance(value, str):
+                errors.append(f"поле {field} должно быть строкой")
+                continue
+            task[field] = value.lower()
+        if not task.get('title', True):
+            errors.append("не указано название")
+
+        due_date = row.get('due_date')
+        try:
+            due_date = due_date if isinstance(due_date, date) else parse_date(due_date)
+            if due_date <= today:
+                errors.append(f"срок выполнения не позже сегодняшнего дня: {due_date}")
+            task['due_date'] = due_date
+        except (ValueError, TypeError):
+            errors.append(f"некорректный срок выполнения: {due_date!r}")
+
+        priority = row.get('priority')
+        priority = priority.lower() if isinstance(priority, str) else priority
+        if priority not in PRIORITIES:
+            errors.append(f"некорректный приоритет: {priority!r}")
+        task['priority'] = priority
+
+        status = row.get('status') or 'не выполнена'
+        status = status.lower() if isinstance(status, str) else status
+        if status not in STATUSES:
+            errors.append(f"некорректный статус: {status!r}")
+        task['status'] = status
+
+        if errors:
+            rejected.append((number, row, errors))
+        else:
+            valid.append(task)
+    return report
+
+
+def read_rows(file_path: str) -> List[dict]:
+    """
+    Функция, читающая строки для импорта из CSV (с заголовком) или JSON файла.
+
+    :param file_path: str, путь к файлу с расширением .csv или .json
+    :return: List[dict], строки файла
+    """
+    with open(file_path, 'r', encoding='utf-8', newline='') as file:
+        if file_path.endswith('.csv'):
+            return list(csv.DictReader(file))
+        return json.load(file)
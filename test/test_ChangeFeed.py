@@ -0,0 +1,126 @@
+import unittest
+import asyncio
+import tempfile
+import threading
+import os
+from database.changes import ChangeFeed
+
+
+class TestChangeFeed(unittest.TestCase):
+
+    def setUp(self):
+        # Создаем временный файл журнала изменений
+        self.temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.jsonl')
+        self.temp_file.close()
+        self.feed = ChangeFeed(self.temp_file.name)
+
+    def tearDown(self):
+        # Удаляем временный файл после тестирования
+        os.remove(self.temp_file.name)
+
+    def test_publish_callbacks(self):
+        events = []
+        self.feed.subscribe(events.append)
+        self.feed.publish('add', 1, {"id": 1, "title": "Задача"})
+        self.feed.publish('delete', 1)
+        self.feed.unsubscribe(events.append)
+        self.feed.publish('add', 2, {"id": 2})
+
+        self.assertEqual([(event.seq, event.action, event.task_id) for event in events],
+                         [(1, 'add', 1), (2, 'delete', 1)])
+        self.assertEqual(self.feed.seq, 3)
+
+    def test_read_changes_since(self):
+        for task_id in range(1, 6):
+            self.feed.publish('add', task_id, {"id": task_id, "title": "Задача"})
+
+        events = list(self.feed.read_changes(since_seq=3))
+        self.assertEqual([event.seq for event in events], [4, 5])
+        self.assertEqual(events[0].task, {"id": 4, "title": "Задача"})
+
+    def test_record_many(self):
+        events = []
+        self.feed.subscribe(events.append)
+        self.feed.record_many([('add', 1, {"id": 1}), ('add', 2, {"id": 2})])
+        self.feed.flush()
+        self.assertEqual([event.seq for event in events], [1, 2])
+        self.assertEqual([event.task_id for event in self.feed.read_changes(since_seq=1)], [2])
+        self.assertEqual(ChangeFeed(self.temp_file.name).seq, 2)
+
+    def test_seq_resumes_from_file(self):
+        self.feed.publish('add', 1, {"id": 1})
+        self.feed.publish('add', 2, {"id": 2, "description": "д" * 5000})
+
+        feed = ChangeFeed(self.temp_file.name)
+        self.assertEqual(feed.seq, 2)
+        self.assertEqual(feed.publish('delete', 1).seq, 3)
+
+    def test_partial_and_corrupt_lines(self):
+        self.feed.publish('add', 1, {"id": 1})
+        with open(self.temp_file.name, 'a', encoding='utf-8') as file:
+            file.write('not json\n{"seq": 2, "act')
+
+        feed = ChangeFeed(self.temp_file.name)
+        self.assertEqual(feed.seq, 1)
+        self.assertEqual([event.seq for event in feed.read_changes()], [1])
+
+        # Дописанная до конца строка читается при следующем вызове
+        with open(self.temp_file.name, 'a', encoding='utf-8') as file:
+            file.write('ion": "delete", "task_id": 1, "task": null}\n')
+        self.assertEqual([event.seq for event in feed.read_changes(since_seq=1)], [2])
+        self.assertEqual(ChangeFeed(self.temp_file.name).seq, 2)
+
+    def test_partial_line_after_long_line(self):
+        self.feed.publish('add', 1, {"id": 1, "description": "д" * 5000})
+        with open(self.temp_file.name, 'a', encoding='utf-8') as file:
+            file.write('{"seq": 2, "act')
+        feed = ChangeFeed(self.temp_file.name)
+        self.assertEqual(feed.seq, 1)
+
+        # Новая запись начинается с новой строки и не склеивается с оборванной
+        feed.publish('delete', 1)
+        self.assertEqual([event.seq for event in feed.read_changes()], [1, 2])
+
+    def test_without_file(self):
+        feed = ChangeFeed()
+        self.assertEqual(feed.publish('add', 1).seq, 1)
+        self.assertEqual(list(feed.read_changes()), [])
+
+    def test_subscribe_queue(self):
+        async def consume():
+            queue = self.feed.subscribe_queue()
+            thread = threading.Thread(target=self.feed.publish, args=('add', 1, {"id": 1}))
+            thread.start()
+            event = await asyncio.wait_for(queue.get(), timeout=1)
+            thread.join()
+            self.feed.unsubscribe_queue(queue)
+            return event
+
+        event = asyncio.run(consume())
+        self.assertEqual((event.seq, event.action), (1, 'add'))
+
+    def test_closed_queue_loop(self):
+        async def subscribe():
+            return self.feed.subscribe_queue()
+
+        asyncio.run(subscribe())
+        events = []
+        self.feed.subscribe(events.append)
+        with self.assertLogs('database.changes', level='ERROR'):
+            self.feed.publish('add', 1)
+        self.feed.publish('add', 2)
+        self.assertEqual([event.seq for event in events], [1, 2])
+
+    def test_record_defers_delivery(self):
+        events = []
+        self.feed.subscribe(events.append)
+        self.feed.record('add', 1)
+        self.feed.record('delete', 1)
+        self.assertEqual(events, [])
+        self.feed.flush()
+        self.assertEqual([event.seq for event in events], [1, 2])
+        self.assertEqual(len(list(self.feed.read_changes())), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
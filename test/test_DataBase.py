@@ -2,7 +2,9 @@ import unittest
 import tempfile
 import json
 import os
+import threading
 from datetime import date
+from unittest.mock import patch
 from database.database import DataBase
 
 
@@ -100,6 +102,254 @@ class TestDataBase(unittest.TestCase):
         db.update_task_status(1, "done")
         self.assertEqual(db.tasks[0].status, "done")
 
+    def test_work_queue(self):
+        db = DataBase(file_path=self.temp_file.name)
+        db.add_task("Task 1", "Description 1", "Category 1", date(2027, 1, 2), "низкий")
+        db.add_task("Task 2", "Description 2", "Category 2", date(2027, 1, 3), "высокий")
+        db.add_task("Task 3", "Description 3", "Category 3", date(2027, 1, 1), "высокий")
+        self.assertEqual([task.task_id for task in db.top_k(3)], [3, 2, 1])
+
+        db.update_task_info(1, priority="высокий", due_date=date(2026, 12, 31))
+        db.delete_task(3)
+        self.assertEqual(db.peek_next().task_id, 1)
+
+        self.assertEqual(db.pop_next().task_id, 1)
+        self.assertEqual(db.tasks[0].status, "выполнена")
+        self.assertEqual(DataBase(file_path=self.temp_file.name).peek_next().task_id, 2)
+
+        db.update_task_status(2, "выполнена")
+        self.assertIsNone(db.pop_next())
+
+    def test_change_feed(self):
+        db = DataBase(file_path=self.temp_file.name)
+        events = []
+        db.changes.subscribe(events.append)
+        db.add_task("Task 1", "Description 1", "Category 1", date(2027, 1, 1), "высокий")
+        db.update_task_info(1, title="Updated Task 1")
+        db.update_task_status(1, "выполнена")
+        db.delete_task(1)
+        db.delete_task(1)
+
+        self.assertEqual([(event.seq, event.action) for event in events],
+                         [(1, 'add'), (2, 'update'), (3, 'status'), (4, 'delete')])
+        self.assertEqual(events[1].task['title'], "Updated Task 1")
+        self.assertEqual(events[2].task['status'], "выполнена")
+        self.assertIsNone(events[3].task)
+
+    def test_change_feed_subscriber_errors(self):
+        db = DataBase(file_path=self.temp_file.name)
+        events = []
+
+        def failing(event):
+            raise RuntimeError("subscriber failed")
+
+        db.changes.subscribe(failing)
+        db.changes.subscribe(events.append)
+        with self.assertLogs('database.changes', level='ERROR'):
+            db.add_task("Task 1", "Description 1", "Category 1", date(2027, 1, 1), "высокий")
+        self.assertEqual([event.seq for event in events], [1])
+        self.assertEqual(len(DataBase(file_path=self.temp_file.name).tasks), 1)
+
+    def test_change_feed_callback_reads_thread_safe(self):
+        db = DataBase(file_path=self.temp_file.name, thread_safe=True)
+        seen = []
+        db.changes.subscribe(lambda event: seen.append(len(db.search_task(category="Category 1"))))
+        thread = threading.Thread(target=db.add_task,
+                                  args=("Task 1", "Description 1", "Category 1", date(2027, 1, 1), "высокий"))
+        thread.start()
+        thread.join(timeout=2)
+        self.assertFalse(thread.is_alive())
+        self.assertEqual(seen, [1])
+
+    def test_subscribe_with_snapshot(self):
+        db = DataBase(file_path=self.temp_file.name, thread_safe=True)
+        db.add_task("Task 1", "Description 1", "Category 1", date(2027, 1, 1), "высокий")
+        events = []
+        snapshot = db.subscribe_with_snapshot(events.append)
+        db.add_task("Task 2", "Description 2", "Category 2", date(2027, 1, 2), "низкий")
+
+        self.assertEqual([task.task_id for task in snapshot], [1])
+        self.assertNotIn(snapshot[0], db._tasks)
+        self.assertEqual([event.task_id for event in events], [2])
+
+    def test_import_tasks(self):
+        db = DataBase(file_path=self.temp_file.name)
+        events = []
+        db.changes.subscribe(events.append)
+        report = db.import_tasks([
+            {"title": "Task 1", "description": "", "category": "", "due_date": "01.01.2099", "priority": "низкий"},
+            {"title": "Task 2", "description": "", "category": "", "due_date": "01.01.2000", "priority": "низкий"},
+            {"title": "Task 3", "description": "", "category": "", "due_date": "2099-01-02", "priority": "высокий",
+             "status": "выполнена"},
+        ])
+
+        self.assertEqual(len(report.valid), 2)
+        self.assertEqual([number for number, _, _ in report.rejected], [2])
+        self.assertEqual([task.task_id for task in db.tasks], [1, 2])
+        self.assertEqual(db.tasks[1].due_date, date(2099, 1, 2))
+        self.assertEqual(db.peek_next().task_id, 1)
+        self.assertEqual(len(events), 2)
+        self.assertEqual(len(DataBase(file_path=self.temp_file.name).tasks), 2)
+
+    def test_thread_safe_work_queue_returns_copies(self):
+        db = DataBase(file_path=self.temp_file.name, thread_safe=True)
+        db.add_task("Task 1", "Description 1", "Category 1", date(2027, 1, 1), "низкий")
+        db.add_task("Task 2", "Description 2", "Category 2", date(2027, 1, 2), "средний")
+
+        for task in [db.peek_next()] + db.top_k(2):
+            self.assertNotIn(task, db._tasks)
+            task.priority = "высокий"
+        self.assertEqual([task.task_id for task in db.top_k(2)], [2, 1])
+
+        popped = db.pop_next()
+        self.assertEqual((popped.task_id, popped.status), (2, "выполнена"))
+        self.assertNotIn(popped, db._tasks)
+        popped.status = "не выполнена"
+        self.assertEqual(db.peek_next().task_id, 1)
+
+    def test_compressed_save_and_load(self):
+        for compression in ('gzip', 'lzma', 'zlib'):
+            with self.subTest(compression=compression):
+                open(self.temp_file.name, 'w').close()
+                db = DataBase(file_path=self.temp_file.name, compression=compression)
+                db.add_task("Задача 1", "Описание 1", "Категория 1", date(2023, 12, 1), "высокий")
+                db.add_task("Задача 2", "Описание 2", "Категория 2", date(2023, 12, 2), "низкий")
+
+                with open(self.temp_file.name, 'rb') as file:
+                    self.assertRaises(UnicodeDecodeError, file.read().decode, 'utf-8')
+
+                loaded = DataBase(file_path=self.temp_file.name)
+                self.assertEqual(loaded.compression, compression)
+                self.assertEqual(len(loaded.tasks), 2)
+                self.assertEqual(loaded.tasks[1].title, "Задача 2")
+                self.assertEqual(loaded.tasks[1].due_date, date(2023, 12, 2))
+                self.assertEqual(loaded.next_id, 3)
+
+    def test_unknown_compression(self):
+        with open(self.temp_file.name, 'w', encoding='utf-8') as file:
+            file.write('[]')
+        self.assertRaises(ValueError, DataBase, file_path=self.temp_file.name, compression='bz2')
+        with open(self.temp_file.name, 'r', encoding='utf-8') as file:
+            self.assertEqual(file.read(), '[]')
+
+    def test_failed_save_keeps_file(self):
+        db = DataBase(file_path=self.temp_file.name, compression='gzip')
+        db.add_task("Task 1", "Description 1", "Category 1", date(2023, 12, 1), "high")
+        with open(self.temp_file.name, 'rb') as file:
+            saved = file.read()
+        directory = os.path.dirname(self.temp_file.name)
+        files = set(os.listdir(directory))
+
+        with patch('database.database.compress', side_effect=MemoryError):
+            self.assertRaises(MemoryError, db.add_task, "Task 2", "Description 2", "Category 2",
+                              date(2023, 12, 2), "medium")
+        with open(self.temp_file.name, 'rb') as file:
+            self.assertEqual(file.read(), saved)
+        self.assertEqual({name for name in os.listdir(directory) if name.endswith('.tmp')},
+                         {name for name in files if name.endswith('.tmp')})
+
+    def test_plain_file_stays_plain(self):
+        db = DataBase(file_path=self.temp_file.name)
+        db.add_task("Task 1", "Description 1", "Category 1", date(2023, 12, 1), "high")
+        self.assertIsNone(DataBase(file_path=self.temp_file.name).compression)
+
+        with open(self.temp_file.name, 'r', encoding='utf-8') as file:
+            self.assertEqual(json.load(file)[0]['title'], "Task 1")
+
+    def test_thread_safe_tasks_snapshot(self):
+        db = DataBase(file_path=self.temp_file.name, thread_safe=True)
+        db.add_task("Task 1", "Description 1", "Category 1", date(2023, 12, 1), "high")
+
+        snapshot = db.tasks
+        found = db.search_task(category="Category 1")
+        db.add_task("Task 2", "Description 2", "Category 2", date(2023, 12, 2), "medium")
+        db.update_task_info(1, title="Updated Task 1", category="Updated Category 1")
+        self.assertEqual(len(snapshot), 1)
+        self.assertEqual(snapshot[0].title, "Task 1")
+        self.assertEqual(found[0].category, "Category 1")
+        self.assertEqual(len(db.tasks), 2)
+
+    def test_thread_safe_concurrent_add(self):
+        db = DataBase(file_path=self.temp_file.name, thread_safe=True)
+        threads_count, tasks_per_thread = 8, 25
+        errors = []
+
+        def writer(n):
+            for i in range(tasks_per_thread):
+                db.add_task(f"Task {n}-{i}", "Description", "Category", date(2023, 12, 1), "high")
+
+        def reader():
+            try:
+                for _ in range(tasks_per_thread):
+                    db.search_task(category="Category")
+                    for task in db.tasks:
+                        self.assertIsNotNone(task.task_id)
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=writer, args=(n,)) for n in range(threads_count)]
+        threads += [threading.Thread(target=reader) for _ in range(threads_count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        ids = [task.task_id for task in db.tasks]
+        self.assertEqual(len(ids), threads_count * tasks_per_thread)
+        self.assertEqual(len(set(ids)), len(ids))
+        self.assertEqual(db.next_id, threads_count * tasks_per_thread + 1)
+        self.assertEqual(len(DataBase(file_path=self.temp_file.name).tasks), threads_count * tasks_per_thread)
+
+    def test_thread_safe_concurrent_delete_and_update(self):
+        db = DataBase(file_path=self.temp_file.name, thread_safe=True)
+        initial, added, threads_count = 200, 100, 4
+        for i in range(initial):
+            db.add_task(f"Task {i}", "Description", "Category", date(2023, 12, 1), "high")
+        errors = []
+
+        def deleter(n):
+            for task_id in range(1 + 2 * n, initial + 1, 2 * threads_count):
+                self.assertTrue(db.delete_task(task_id))
+
+        def updater(n):
+            for task_id in range(2 + 2 * n, initial + 1, 2 * threads_count):
+                db.update_task_info(task_id, title=f"Updated {task_id}", category="Updated")
+                self.assertTrue(db.update_task_status(task_id, "done"))
+
+        def writer(n):
+            for i in range(added // threads_count):
+                db.add_task(f"New {n}-{i}", "Description", "New", date(2023, 12, 1), "high")
+
+        def reader():
+            try:
+                for _ in range(50):
+                    for task in db.search_task(category="Updated"):
+                        # Изменение задачи не должно быть видно наполовину
+                        self.assertEqual(task.title, f"Updated {task.task_id}")
+                    self.assertEqual(len({task.task_id for task in db.tasks}), len(db.tasks))
+            except Exception as e:
+                errors.append(e)
+
+        threads = []
+        for n in range(threads_count):
+            threads += [threading.Thread(target=target, args=(n,)) for target in (deleter, updater, writer)]
+            threads.append(threading.Thread(target=reader))
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        for loaded in (db, DataBase(file_path=self.temp_file.name)):
+            tasks = {task.task_id: task for task in loaded.tasks}
+            expected_ids = set(range(2, initial + 1, 2)) | set(range(initial + 1, initial + added + 1))
+            self.assertEqual(set(tasks), expected_ids)
+            for task_id in range(2, initial + 1, 2):
+                self.assertEqual(tasks[task_id].status, "done")
+                self.assertEqual(tasks[task_id].category, "Updated")
+            self.assertEqual(sum(task.category == "New" for task in tasks.values()), added)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,62 @@
+import unittest
+import threading
+import time
+from database.lock import ReadWriteLock
+
+
+class TestReadWriteLock(unittest.TestCase):
+
+    def setUp(self):
+        self.lock = ReadWriteLock()
+
+    def test_concurrent_readers(self):
+        inside = threading.Barrier(2, timeout=1)
+
+        def reader():
+            with self.lock.read():
+                # Оба читателя должны одновременно оказаться внутри блокировки
+                inside.wait()
+
+        threads = [threading.Thread(target=reader) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertFalse(inside.broken)
+
+    def test_writer_is_exclusive(self):
+        counter = {'value': 0}
+
+        def writer():
+            for _ in range(1000):
+                with self.lock.write():
+                    value = counter['value']
+                    time.sleep(0)
+                    counter['value'] = value + 1
+
+        threads = [threading.Thread(target=writer) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(counter['value'], 4000)
+
+    def test_writer_waits_for_readers(self):
+        events = []
+        self.lock.acquire_read()
+
+        def writer():
+            with self.lock.write():
+                events.append('write')
+
+        thread = threading.Thread(target=writer)
+        thread.start()
+        time.sleep(0.05)
+        events.append('read released')
+        self.lock.release_read()
+        thread.join()
+        self.assertEqual(events, ['read released', 'write'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,137 @@
+import unittest
+import tempfile
+import threading
+import os
+from datetime import date, datetime, timedelta
+from database.database import DataBase
+from database.reminders import ReminderScheduler
+
+
+class TestReminderScheduler(unittest.TestCase):
+
+    def setUp(self):
+        # Создаем временный файл для тестирования
+        self.temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.json')
+        self.temp_file.close()
+        self.db = DataBase(file_path=self.temp_file.name)
+        self.now = datetime(2027, 1, 1, 12, 0)
+        self.fired = []
+        self.scheduler = ReminderScheduler(self.db, lambda *reminder: self.fired.append(reminder),
+                                           lead_times=(timedelta(days=1), timedelta(hours=1)),
+                                           clock=lambda: self.now)
+
+    def tearDown(self):
+        # Удаляем временный файл после тестирования
+        os.remove(self.temp_file.name)
+
+    def advance(self, **kwargs):
+        self.now += timedelta(**kwargs)
+        return self.scheduler.tick()
+
+    def test_fires_at_lead_times(self):
+        self.db.add_task("Task 1", "Description 1", "Category 1", date(2027, 1, 5), "высокий")
+        self.assertEqual(self.scheduler.next_fire_time(), datetime(2027, 1, 4))
+        self.assertEqual(self.advance(days=2), [])
+        self.assertEqual(self.advance(hours=12), [(1, date(2027, 1, 5), timedelta(days=1))])
+        self.assertEqual(self.advance(hours=23), [(1, date(2027, 1, 5), timedelta(hours=1))])
+        self.assertEqual(self.advance(days=1), [])
+        self.assertEqual(len(self.fired), 2)
+
+    def test_reschedule_on_due_date_change(self):
+        self.db.add_task("Task 1", "Description 1", "Category 1", date(2027, 1, 5), "высокий")
+        self.db.update_task_info(1, due_date=date(2027, 1, 10))
+        self.assertEqual(self.advance(days=3), [])
+        self.assertEqual(self.scheduler.next_fire_time(), datetime(2027, 1, 9))
+
+        self.db.update_task_info(1, title="Updated Task 1")
+        self.assertEqual(len(self.advance(days=5)), 1)
+        self.db.update_task_info(1, title="Updated Task 1 again")
+        self.assertEqual(self.advance(minutes=1), [])
+
+    def test_cancel_on_delete_and_done(self):
+        self.db.add_task("Task 1", "Description 1", "Category 1", date(2027, 1, 5), "высокий")
+        self.db.add_task("Task 2", "Description 2", "Category 2", date(2027, 1, 5), "низкий")
+        self.db.delete_task(1)
+        self.db.update_task_status(2, "выполнена")
+        self.assertEqual(len(self.scheduler), 0)
+        self.assertEqual(self.advance(days=5), [])
+        self.assertIsNone(self.scheduler.next_fire_time())
+
+    def test_existing_tasks_and_past_deadlines(self):
+        self.db.add_task("Task 1", "Description 1", "Category 1", date(2027, 1, 2), "высокий")
+        self.db.add_task("Task 2", "Description 2", "Category 2", date(2026, 12, 1), "низкий")
+        scheduler = ReminderScheduler(DataBase(file_path=self.temp_file.name), lambda *reminder: None,
+                                      clock=lambda: self.now)
+        self.assertEqual(len(scheduler), 2)
+        # Напоминание за день до срока уже наступило, просроченная задача не напоминает
+        self.assertEqual(scheduler.tick(), [(1, date(2027, 1, 2), timedelta(days=1))])
+
+    def test_close_unsubscribes(self):
+        self.scheduler.close()
+        self.scheduler.close()
+        self.db.add_task("Task 1", "Description 1", "Category 1", date(2027, 1, 2), "высокий")
+        self.assertEqual(len(self.scheduler), 0)
+
+    def test_no_change_missed_during_init(self):
+        db = DataBase(file_path=self.temp_file.name, thread_safe=True)
+        started = threading.Event()
+
+        def writer():
+            started.set()
+            for i in range(50):
+                db.add_task(f"Task {i}", "Description", "Category", date(2027, 2, 1), "высокий")
+
+        thread = threading.Thread(target=writer)
+        thread.start()
+        started.wait()
+        scheduler = ReminderScheduler(db, lambda *reminder: None, clock=lambda: self.now)
+        thread.join()
+        self.assertEqual(len(scheduler), 50)
+        scheduler.close()
+
+    def test_failing_callback(self):
+        def callback(task_id, due_date, lead_time):
+            if task_id == 1:
+                raise RuntimeError("callback failed")
+            self.fired.append(task_id)
+
+        self.scheduler.callback = callback
+        self.db.add_task("Task 1", "Description 1", "Category 1", date(2027, 1, 5), "высокий")
+        self.db.add_task("Task 2", "Description 2", "Category 2", date(2027, 1, 5), "низкий")
+        with self.assertLogs('database.reminders', level='ERROR'):
+            self.assertEqual(len(self.advance(days=3)), 2)
+        self.assertEqual(self.fired, [2])
+
+    def test_run_survives_failing_callback(self):
+        fired = threading.Event()
+
+        def callback(task_id, due_date, lead_time):
+            if task_id == 1:
+                raise RuntimeError("callback failed")
+            fired.set()
+
+        self.scheduler.callback = callback
+        self.db.add_task("Task 1", "Description 1", "Category 1", date(2027, 1, 2), "высокий")
+        with self.assertLogs('database.reminders', level='ERROR'):
+            thread = threading.Thread(target=self.scheduler.run, kwargs={'max_interval': 0.01})
+            thread.start()
+            # Первое напоминание падает, поток должен продолжить работу и обработать следующее
+            self.db.add_task("Task 2", "Description 2", "Category 2", date(2027, 1, 2), "низкий")
+            self.assertTrue(fired.wait(timeout=1))
+            self.assertTrue(thread.is_alive())
+            self.scheduler.stop()
+            thread.join(timeout=1)
+        self.assertFalse(thread.is_alive())
+
+    def test_run_and_stop(self):
+        thread = threading.Thread(target=self.scheduler.run, kwargs={'max_interval': 0.01})
+        thread.start()
+        self.db.add_task("Task 1", "Description 1", "Category 1", date(2027, 1, 2), "высокий")
+        self.scheduler.stop()
+        thread.join(timeout=1)
+        self.assertFalse(thread.is_alive())
+        self.assertNotIn(self.scheduler.on_change, self.db.changes._callbacks)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,68 @@
+import unittest
+import random
+from datetime import date, timedelta
+from task.task import Task
+from database.task_queue import TaskQueue
+
+
+class TestTaskQueue(unittest.TestCase):
+
+    def setUp(self):
+        self.tasks = [
+            Task(1, "Task 1", "Description 1", "Category 1", date(2027, 1, 3), "низкий", "не выполнена"),
+            Task(2, "Task 2", "Description 2", "Category 2", date(2027, 1, 2), "высокий", "не выполнена"),
+            Task(3, "Task 3", "Description 3", "Category 3", date(2027, 1, 1), "высокий", "не выполнена"),
+            Task(4, "Task 4", "Description 4", "Category 4", date(2027, 1, 1), "средний", "выполнена"),
+            Task(5, "Task 5", "Description 5", "Category 5", date(2027, 1, 1), "средний", "не выполнена"),
+        ]
+        self.queue = TaskQueue(self.tasks)
+
+    def test_order(self):
+        self.assertEqual(len(self.queue), 4)
+        self.assertEqual([task.task_id for task in self.queue.top_k(10)], [3, 2, 5, 1])
+        self.assertEqual(self.queue.peek().task_id, 3)
+
+    def test_pop(self):
+        self.assertEqual(self.queue.pop().task_id, 3)
+        self.assertEqual(self.queue.pop().task_id, 2)
+        self.assertEqual(self.queue.top_k(1)[0].task_id, 5)
+        self.assertEqual(len(self.queue), 2)
+
+    def test_update_and_discard(self):
+        self.tasks[0].priority = "высокий"
+        self.tasks[0].due_date = date(2026, 12, 31)
+        self.queue.update(self.tasks[0])
+        self.queue.discard(2)
+        self.tasks[2].status = "выполнена"
+        self.queue.update(self.tasks[2])
+        self.assertEqual([task.task_id for task in self.queue.top_k(10)], [1, 5])
+        self.assertEqual(self.queue.peek().task_id, 1)
+
+    def test_empty(self):
+        queue = TaskQueue()
+        self.assertIsNone(queue.peek())
+        self.assertIsNone(queue.pop())
+        self.assertEqual(queue.top_k(3), [])
+
+    def test_matches_sorting_after_random_updates(self):
+        rnd = random.Random(0)
+        priorities = ["низкий", "средний", "высокий"]
+        tasks = [Task(i, f"Task {i}", "", "", date(2027, 1, 1) + timedelta(days=rnd.randint(0, 30)),
+                      rnd.choice(priorities), "не выполнена") for i in range(1, 201)]
+        queue = TaskQueue(tasks)
+        for _ in range(500):
+            task = rnd.choice(tasks)
+            task.priority = rnd.choice(priorities)
+            task.status = rnd.choice(["выполнена", "не выполнена"])
+            queue.update(task)
+
+        rank = {"высокий": 0, "средний": 1, "низкий": 2}
+        expected = sorted((task for task in tasks if task.status == "не выполнена"),
+                          key=lambda task: (rank[task.priority], task.due_date, task.task_id))
+        self.assertEqual(queue.top_k(20), expected[:20])
+        self.assertEqual([queue.pop() for _ in range(len(expected))], expected)
+        self.assertIsNone(queue.pop())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,68 @@
+import unittest
+import tempfile
+import json
+import os
+from datetime import date
+from database.validation import parse_date, validate_tasks, read_rows
+
+
+class TestValidation(unittest.TestCase):
+
+    def setUp(self):
+        self.today = date(2026, 1, 1)
+        self.row = {"title": "Задача", "description": "Описание", "category": "Работа",
+                    "due_date": "01.02.2026", "priority": "Высокий", "status": ""}
+
+    def test_parse_date(self):
+        self.assertEqual(parse_date("01.02.2026"), date(2026, 2, 1))
+        self.assertEqual(parse_date("2026-02-01"), date(2026, 2, 1))
+        for value in ("31.02.2026", "1.2.2026", "0a.02.2026", "invalid"):
+            with self.subTest(value=value):
+                self.assertRaises(ValueError, parse_date, value)
+
+    def test_valid_row(self):
+        report = validate_tasks([self.row], today=self.today)
+        self.assertEqual(report.rejected, [])
+        self.assertEqual(report.valid, [{"title": "задача", "description": "описание", "category": "работа",
+                                         "due_date": date(2026, 2, 1), "priority": "высокий",
+                                         "status": "не выполнена"}])
+
+    def test_collects_all_errors(self):
+        row = {"title": "", "description": 1, "due_date": "01.01.2025", "priority": "срочный", "status": "отложена"}
+        report = validate_tasks([self.row, row], today=self.today)
+        self.assertEqual(len(report.valid), 1)
+        self.assertEqual(len(report.rejected), 1)
+        number, rejected_row, errors = report.rejected[0]
+        self.assertEqual(number, 2)
+        self.assertIs(rejected_row, row)
+        self.assertEqual(len(errors), 5)
+        self.assertIn("Строка 2", str(report))
+
+    def test_non_dict_rows(self):
+        report = validate_tasks([["Задача", "01.02.2026"], "title", self.row], today=self.today)
+        self.assertEqual(len(report.valid), 1)
+        self.assertEqual([(number, errors) for number, _, errors in report.rejected],
+                         [(1, ["строка должна быть объектом"]), (2, ["строка должна быть объектом"])])
+
+    def test_invalid_date(self):
+        for value in (None, "32.01.2026", ["01.02.2026"], "01.01.2026"):
+            with self.subTest(value=value):
+                report = validate_tasks([dict(self.row, due_date=value)], today=self.today)
+                self.assertEqual(len(report.rejected), 1)
+
+    def test_read_rows(self):
+        with tempfile.TemporaryDirectory() as directory:
+            csv_path = os.path.join(directory, 'tasks.csv')
+            with open(csv_path, 'w', encoding='utf-8') as file:
+                file.write("title,description,category,due_date,priority,status\n"
+                           "Задача,Описание,Работа,01.02.2026,высокий,\n")
+            json_path = os.path.join(directory, 'tasks.json')
+            with open(json_path, 'w', encoding='utf-8') as file:
+                json.dump([self.row], file, ensure_ascii=False)
+
+            self.assertEqual(read_rows(csv_path)[0]["due_date"], "01.02.2026")
+            self.assertEqual(read_rows(json_path), [self.row])
+
+
+if __name__ == '__main__':
+    unittest.main()